@@ -1,19 +1,69 @@
-import random as rd
+import os
+import zlib
+import functools
+import logging
+from collections import OrderedDict
 
 from PySide6.QtWidgets import \
     QStyledItemDelegate, \
     QStyleOptionViewItem, \
     QFileIconProvider, \
     QStyle
-from PySide6.QtGui import QPainter, QFont, QMouseEvent, QPixmap, QColor
-from PySide6.QtCore import Qt, QRect, QSortFilterProxyModel, QSize, QEvent
+from PySide6.QtGui import QPainter, QFont, QMouseEvent, QPixmap, QPixmapCache, QColor, QIcon, QStaticText, QImage, \
+    QImageReader, QImageIOHandler
+from PySide6.QtCore import Qt, QRect, QRectF, QSortFilterProxyModel, QSize, QEvent, QTimer, \
+    QObject, QRunnable, QThreadPool, Signal, QPersistentModelIndex
 
 
 from TagManager import TagManager
-from ModInfo import ModInfo
+from ModInfo import ModInfo, is_disabled_name, enabled_name
 
-def generate_color(tag: str, offset = rd.randint(0, 300)):
-    return QColor.fromHsv((sum(map(ord, tag)) + offset) % 300 + 30, 200, 128)
+log = logging.getLogger(__name__)
+
+_IMAGE_EXTS = frozenset({".jpg", ".jpeg", ".png", ".gif", ".bmp", ".ico", ".svg", ".webp", ".tiff"})
+# Types whose icon comes from the file itself (embedded resources, shortcut targets),
+# so it cannot be shared by suffix
+_PER_FILE_ICON_EXTS = frozenset({"exe", "lnk", "url", "ico", "cur", "ani"})
+
+@functools.lru_cache(maxsize=1024)
+def generate_color(tag: str) -> QColor:
+    return QColor.fromHsv(zlib.crc32(tag.encode("utf-8")) % 300 + 30, 200, 128)
+
+
+class _PreviewSignals(QObject):
+    """Carries decoded previews from pool threads back to the GUI thread."""
+    loaded = Signal(str, QImage)
+
+
+class _PreviewLoader(QRunnable):
+    """Decodes and scales one image preview off the GUI thread.
+
+    Works on QImage, which unlike QPixmap may be used outside the GUI thread.
+    Formats that can decode at a reduced size (e.g. JPEG) are read straight at
+    preview size. Emits a null image if the file could not be decoded.
+    """
+
+    def __init__(self, signals: _PreviewSignals, key: str, file_path: str, size: int, transformation):
+        super().__init__()
+        self.signals = signals
+        self.key = key
+        self.file_path = file_path
+        self.size = size
+        self.transformation = transformation
+
+    def run(self):
+        reader = QImageReader(self.file_path)
+        full_size = reader.size()
+        if (full_size.width() > self.size or full_size.height() > self.size) \
+                and reader.supportsOption(QImageIOHandler.ImageOption.ScaledSize):
+            reader.setScaledSize(full_size.scaled(self.size, self.size, Qt.KeepAspectRatio))
+        image = reader.read()
+        fitted = image.width() <= self.size and image.height() <= self.size \
+            and self.size in (image.width(), image.height())
+        if not image.isNull() and not fitted:
+            # Scale to fit in size x size while maintaining aspect ratio
+            image = image.scaled(self.size, self.size, Qt.KeepAspectRatio, self.transformation)
+        self.signals.loaded.emit(self.key, image)
 
 
 class FileItemDelegate(QStyledItemDelegate):
@@ -24,70 +74,171 @@ class FileItemDelegate(QStyledItemDelegate):
     to using full widget-based items.
     """
 
-    def __init__(self, parent=None, tag_manager: TagManager = None):
+    ROW_CACHE_SIZE = 512
+    # (is_dir, lowercased suffix) -> file type icon, shared by every delegate
+    _icon_cache: dict[tuple[bool, str], QIcon] = {}
+    STATIC_TEXT_CACHE_SIZE = 512
+    SCROLL_IDLE_MS = 150
+    PREVIEW_SIZE = 42  # Slightly smaller than the 48px icon area to show its edge
+
+    # Fixed colors, built once rather than per row
+    _SELECTED_BG = QColor(30, 30, 30)
+    _DISABLED_BG = QColor(139, 35, 35)  # dark red
+    _ENABLED_BG = QColor(34, 102, 34)  # dark green
+    _WHITE = QColor(255, 255, 255)
+
+    def __init__(self, parent=None, tag_manager: TagManager = None, source_model=None, map_to_source=None,
+                 icon_provider: QFileIconProvider = None):
+        """Create the delegate.
+
+        Pass source_model and map_to_source (proxy index -> source index) when the
+        view's proxy stack is known up front; otherwise it is discovered from the
+        first index painted. icon_provider may be shared with the file model.
+        """
         super().__init__(parent)
-        self.icon_provider = QFileIconProvider()
-        self.preview_cache = {}  # Cache for image previews
+        self.icon_provider = icon_provider or QFileIconProvider()
+        QPixmapCache.setCacheLimit(128 * 1024)  # 128 MiB shared budget for previews and rows
         self.tag_manager = tag_manager
+        # path -> (enabled_name, is_disabled, mtime_str, tags, icon); entries are
+        # dropped on toggle, tag changes, source dataChanged and refresh (invalidate_dir())
+        self._row_cache: OrderedDict[str, tuple[str, bool, str, tuple, QIcon]] = OrderedDict()
+        if tag_manager:
+            tag_manager.add_listener(self.invalidate_path)
+        # (name, font key) -> laid-out QStaticText for the bold name line
+        self._static_text: OrderedDict[tuple[str, str], QStaticText] = OrderedDict()
+        # (tag, font key) -> (pill color, text width, laid-out "#tag" text)
+        self._tag_geom_cache: dict[tuple[str, str], tuple[QColor, int, QStaticText]] = {}
+        # [outermost proxy, ..., source model], built on first use
+        self._proxy_chain = None
+        self._watched_model = None
+        self._source_model = source_model
+        self._map_to_source = map_to_source
+        if source_model is not None:
+            source_model.dataChanged.connect(self._on_source_data_changed)
+            self._watched_model = source_model
+        # Geometry reused across paint() calls and updated in place with setRect()
+        self._icon_rect = QRect()
+        self._inner_rect = QRect()
+        self._name_rect = QRect()
+        self._pill_rect = QRect()
+        # option.font key -> (bold name font, smaller tags font)
+        self._fonts: dict[str, tuple[QFont, QFont]] = {}
 
-    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index):
-        model = index.model()
-        current_index = index
+        # While the view scrolls, previews are scaled with the fast transformation;
+        # once it settles, rows are repainted with smooth previews.
+        self._scrolling = False
+        self._scroll_idle = QTimer(self, singleShot=True, interval=self.SCROLL_IDLE_MS)
+        self._scroll_idle.timeout.connect(self._on_scroll_idle)
+        if parent is not None and hasattr(parent, 'verticalScrollBar'):
+            parent.verticalScrollBar().valueChanged.connect(self._on_scroll)
+
+        # Previews are decoded on the global thread pool; keys handed out but not
+        # yet cached are remembered, with the row to repaint, so each is requested once.
+        self._requested_previews: dict[str, QPersistentModelIndex] = {}
+        self._preview_signals = _PreviewSignals(self)
+        self._preview_signals.loaded.connect(self._on_preview_loaded)
+
+    def _to_source(self, index):
+        """Map index through the (nested) proxy models down to the file system model.
+
+        Returns (source_model, source_index). With an explicit map_to_source this is
+        a single call; otherwise the proxy stack is walked once and remembered, and
+        rebuilt only if index comes from a different model.
+        """
+        if self._map_to_source is not None:
+            return self._source_model, self._map_to_source(index)
+        
+        chain = self._proxy_chain
+        if chain is None or index.model() is not chain[0]:
+            model = index.model()
+            chain = [model]
+            while isinstance(model, QSortFilterProxyModel):
+                model = model.sourceModel()
+                chain.append(model)
+            self._proxy_chain = chain
+            if chain[-1] is not self._watched_model:
+                chain[-1].dataChanged.connect(self._on_source_data_changed)
+                self._watched_model = chain[-1]
         
+        for proxy in chain[:-1]:
+            index = proxy.mapToSource(index)
+        return chain[-1], index
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index):
+        # Skip rows the view asked for but that fall outside what is actually painted
+        if not option.rect.intersects(painter.viewport()):
+            return
+        if painter.hasClipping() and not painter.clipBoundingRect().intersects(QRectF(option.rect)):
+            return
+
         # Handle nested proxy models: map through all layers to get to the source
-        while isinstance(model, QSortFilterProxyModel):
-            current_index = model.mapToSource(current_index)
-            model = model.sourceModel()
+        model, current_index = self._to_source(index)
         
         # Now we have the actual file system model
         file_path = model.filePath(current_index)
-        file_info = model.fileInfo(current_index)
-        mod_info: ModInfo = ModInfo(file_path)
-        
-        name = mod_info.enabledName()
-        size = mod_info.size()
-        mtime = mod_info.lastModified().toString()
+        name, is_disabled, mtime, tags, file_icon = self._row_for(file_path, model, current_index)
+
+        # Rows are rendered once into a pixmap and blitted afterwards; the key covers
+        # everything the rendering depends on, so a changed row simply misses.
+        preview_pixmap = None
+        if self._is_image(file_path):
+            preview_pixmap = self._get_image_preview(file_path, mtime, self.PREVIEW_SIZE, index)
+        preview_key = preview_pixmap.cacheKey() if preview_pixmap else 0
+        selected = bool(option.state & QStyle.State_Selected)
+        dpr = painter.device().devicePixelRatioF()
+        key = (f"row:{file_path}|{mtime}|{option.rect.width()}x{option.rect.height()}@{dpr}|{selected}|{is_disabled}"
+               f"|{hash(tags)}|{preview_key}|{option.font.key()}|{option.palette.text().color().rgba()}")
+        row_pixmap = QPixmap()
+        if not QPixmapCache.find(key, row_pixmap):
+            # Render on a premultiplied QImage, the raster engine's native format, so no
+            # conversion or platform pixmap round-trip happens while painting
+            row_image = QImage(option.rect.size() * dpr, QImage.Format_ARGB32_Premultiplied)
+            row_image.setDevicePixelRatio(dpr)
+            row_image.fill(Qt.transparent)
+            row_option = QStyleOptionViewItem(option)
+            row_option.rect = QRect(0, 0, option.rect.width(), option.rect.height())
+            row_painter = QPainter(row_image)
+            self._paint_row(row_painter, row_option, file_icon, name, is_disabled, tags, preview_pixmap)
+            row_painter.end()
+            row_pixmap = QPixmap.fromImage(row_image)
+            QPixmapCache.insert(key, row_pixmap)
+        painter.drawPixmap(option.rect.topLeft(), row_pixmap)
 
+    def _paint_row(self, painter: QPainter, option: QStyleOptionViewItem, file_icon: QIcon,
+                   name: str, is_disabled: bool, tags: tuple, preview_pixmap):
+        """Paint one row (icon or preview, name and tag pills) into option.rect."""
         painter.save()
+        # Everything here is axis-aligned; antialiasing would only add raster work
+        painter.setRenderHint(QPainter.Antialiasing, False)
 
         # background for selection
         if option.state & QStyle.State_Selected:
-            painter.fillRect(option.rect, QColor(30,30,30))  # light gray
-            text_color = option.palette.text().color()
-        else:
-            text_color = option.palette.text().color()
+            painter.fillRect(option.rect, self._SELECTED_BG)
 
         # Draw colored circle background (red for disabled, green for enabled)
         margin = 8
         icon_size = 48
-        icon_rect = QRect(option.rect.left() + margin, option.rect.top() + (option.rect.height() - icon_size) // 2, icon_size, icon_size)
+        icon_rect = self._icon_rect
+        icon_rect.setRect(option.rect.left() + margin, option.rect.top() + (option.rect.height() - icon_size) // 2, icon_size, icon_size)
         
         # button background: red for disabled, green for enabled
-        if mod_info.isDisabled():
-            btn_color = QColor(139, 35, 35)  # dark red
-        else:
-            btn_color = QColor(34, 102, 34)  # dark green
-        painter.setBrush(btn_color)
+        painter.setBrush(self._DISABLED_BG if is_disabled else self._ENABLED_BG)
         painter.setPen(Qt.NoPen)
         painter.drawRect(icon_rect)
         
         # Draw icon or preview on top of colored circle
-        # Try to get preview for images, otherwise use file type icon
-        preview_pixmap = None
-        if self._is_image(file_path):
-            preview_pixmap = self._get_image_preview(file_path, icon_size - 6)  # Slightly smaller to show circle edge
-        
+        # Use the image preview if there is one, otherwise the file type icon
         if preview_pixmap:
             # Center the pixmap within the circle
             x_offset = (icon_rect.width() - preview_pixmap.width()) // 2
             y_offset = (icon_rect.height() - preview_pixmap.height()) // 2
             painter.drawPixmap(icon_rect.left() + x_offset, icon_rect.top() + y_offset, preview_pixmap)
         else:
-            # Get file type icon from system and paint it smaller in the center
-            file_icon = self.icon_provider.icon(file_info)
+            # Paint the file type icon smaller in the center
             # Create a smaller rect for the icon inside the circle
             icon_inner_size = icon_size - 8
-            inner_rect = QRect(icon_rect.left() + 4, icon_rect.top() + 4, icon_inner_size, icon_inner_size)
+            inner_rect = self._inner_rect
+            inner_rect.setRect(icon_rect.left() + 4, icon_rect.top() + 4, icon_inner_size, icon_inner_size)
             file_icon.paint(painter, inner_rect, Qt.AlignCenter)
 
         # text area
@@ -95,39 +246,43 @@ class FileItemDelegate(QStyledItemDelegate):
         y = option.rect.top() + margin
         w = option.rect.width() - (x - option.rect.left()) - margin
         # Name (bold)
-        name_font = QFont(option.font)
-        name_font.setBold(True)
+        name_font, tags_font = self._fonts_for(option.font)
         painter.setFont(name_font)
-        painter.setPen(QColor(text_color))
-        painter.drawText(QRect(x, y, w, 20), Qt.AlignLeft | Qt.AlignVCenter, name)
+        painter.setPen(option.palette.text().color())
+        self._name_rect.setRect(x, y, w, 20)
+        static_name = self._static_text_for(name, name_font, painter)
+        name_size = static_name.size()
+        name_y = y + (20 - name_size.height()) / 2
+        if name_size.width() > w:
+            # drawText() clipped long names to the text area; keep doing so
+            painter.save()
+            painter.setClipRect(self._name_rect, Qt.IntersectClip)
+            painter.drawStaticText(x, name_y, static_name)
+            painter.restore()
+        else:
+            painter.drawStaticText(x, name_y, static_name)
 
         # tags (colored pills/badges)
-        tags = []
-        if self.tag_manager:
-            tags = self.tag_manager.get_tags(file_path)
-        
         if tags:
-            tags_font = QFont(option.font)
-            tags_font.setPointSize(max(8, option.font.pointSize() - 3))
             painter.setFont(tags_font)
             
-            # Define tag colors (cycle through different colors)
-            tag_colors = [
-                QColor(100, 150, 200),  # blue
-                QColor(150, 100, 200),  # purple
-                QColor(100, 200, 150),  # green
-                QColor(200, 150, 100),  # orange
-                QColor(200, 100, 150),  # pink
-            ]
-            
             tag_x = x
             tag_y = y + 20
             pill_height = 16
+            font_key = tags_font.key()
+            tag_metrics = painter.fontMetrics()
+            pill_rect = self._pill_rect
             
             for i, tag in enumerate(tags):
-                tag_text = f"#{tag}"
-                tag_metrics = painter.fontMetrics()
-                text_width = tag_metrics.horizontalAdvance(tag_text)
+                geom = self._tag_geom_cache.get((tag, font_key))
+                if geom is None:
+                    tag_text = f"#{tag}"
+                    static_tag = QStaticText(tag_text)
+                    static_tag.setTextFormat(Qt.PlainText)
+                    static_tag.prepare(painter.transform(), tags_font)
+                    geom = (generate_color(tag), tag_metrics.horizontalAdvance(tag_text), static_tag)
+                    self._tag_geom_cache[(tag, font_key)] = geom
+                tag_color, text_width, static_tag = geom
                 pill_width = text_width + 8  # Padding
                 
                 # Only draw if it fits in the row
@@ -135,43 +290,159 @@ class FileItemDelegate(QStyledItemDelegate):
                     break
                 
                 # Draw pill background
-                tag_color = generate_color(tag)
                 painter.setBrush(tag_color)
                 painter.setPen(Qt.NoPen)
-                pill_rect = QRect(tag_x, tag_y, pill_width, pill_height)
+                pill_rect.setRect(tag_x, tag_y, pill_width, pill_height)
                 painter.drawRoundedRect(pill_rect, 4, 4)
                 
                 # Draw text
-                painter.setPen(QColor(255, 255, 255))  # White text
-                painter.drawText(pill_rect, Qt.AlignCenter, tag_text)
+                painter.setPen(self._WHITE)  # White text
+                # Same placement drawText(Qt.AlignCenter) used: centered, rounding down-right
+                painter.drawStaticText(tag_x + (pill_width - text_width + 1) // 2,
+                                       tag_y + (pill_height - int(static_tag.size().height()) + 1) // 2, static_tag)
                 
                 tag_x += pill_width + 4  # Space between pills
         
         painter.restore()
 
+    def _fonts_for(self, font: QFont) -> tuple[QFont, QFont]:
+        """Get the (bold name, smaller tags) fonts derived from the view font, built once per font."""
+        key = font.key()
+        fonts = self._fonts.get(key)
+        if fonts is None:
+            name_font = QFont(font)
+            name_font.setBold(True)
+            tags_font = QFont(font)
+            tags_font.setPointSize(max(8, font.pointSize() - 3))
+            fonts = self._fonts[key] = (name_font, tags_font)
+        return fonts
+
+    def _static_text_for(self, text: str, font: QFont, painter: QPainter) -> QStaticText:
+        """Get a QStaticText for text in font, laid out once and reused across paints."""
+        key = (text, font.key())
+        static_text = self._static_text.get(key)
+        if static_text is None:
+            static_text = QStaticText(text)
+            static_text.setTextFormat(Qt.PlainText)
+            static_text.prepare(painter.transform(), font)
+            self._static_text[key] = static_text
+            if len(self._static_text) > self.STATIC_TEXT_CACHE_SIZE:
+                self._static_text.popitem(last=False)
+        else:
+            self._static_text.move_to_end(key)
+        return static_text
+
+    def _row_for(self, file_path: str, model, source_index) -> tuple[str, bool, str, tuple, QIcon]:
+        """Return (enabled_name, is_disabled, mtime, tags, icon) for a path, built once and cached."""
+        row = self._row_cache.get(file_path)
+        if row is not None:
+            self._row_cache.move_to_end(file_path)
+            return row
+
+        # Name and state come from the basename alone; the time from the model's
+        # QFileInfo, already stat'ed by its gatherer thread, so building a row
+        # never touches the disk
+        file_info = model.fileInfo(source_index)
+        file_name = file_path.rsplit("/", 1)[-1]
+        mtime = file_info.lastModified().toString()
+        tags = self.tag_manager.get_tags(file_path) if self.tag_manager else ()
+        icon = self._icon_for(file_info)
+        row = (enabled_name(file_name), is_disabled_name(file_name), mtime, tags, icon)
+        self._row_cache[file_path] = row
+        if len(self._row_cache) > self.ROW_CACHE_SIZE:
+            self._row_cache.popitem(last=False)
+        return row
+
+    def invalidate_path(self, path: str):
+        """Forget the cached row data for path."""
+        self._row_cache.pop(path, None)
+
+    def invalidate_dir(self, directory: str):
+        """Forget the cached row data for the entries directly inside directory."""
+        directory = os.path.normpath(directory)
+        for path in [p for p in self._row_cache if os.path.dirname(os.path.normpath(p)) == directory]:
+            del self._row_cache[path]
+
+    def _on_source_data_changed(self, top_left, bottom_right, roles=()):
+        model = top_left.model()
+        parent = top_left.parent()
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            self._row_cache.pop(model.filePath(model.index(row, 0, parent)), None)
+
+    def _icon_for(self, file_info) -> QIcon:
+        """Get the file type icon, shared by all files (and delegates) with the same type.
+
+        Files that carry their own icon (executables, shortcuts, icon files) are
+        looked up individually.
+        """
+        key = (True, "") if file_info.isDir() else (False, file_info.suffix().lower())
+        if key[1] in _PER_FILE_ICON_EXTS:
+            return self.icon_provider.icon(file_info)
+        icon = self._icon_cache.get(key)
+        if icon is None:
+            icon = self.icon_provider.icon(file_info)
+            self._icon_cache[key] = icon
+        return icon
+
     def _is_image(self, file_path: str) -> bool:
         """Check if file is an image."""
-        image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.ico', '.svg', '.webp', '.tiff'}
-        return file_path.lower().endswith(tuple(image_extensions))
+        return os.path.splitext(file_path)[1].lower() in _IMAGE_EXTS
+
+    def _get_image_preview(self, file_path: str, mtime: str, size: int, index=None):
+        """Get a cached preview pixmap for an image, or None while it is still loading.
 
-    def _get_image_preview(self, file_path: str, size: int):
-        """Get or create a cached preview pixmap for an image."""
-        if file_path in self.preview_cache:
-            return self.preview_cache[file_path]
+        Previews live in the global QPixmapCache, keyed by path, modification
+        time and size, so edited files get a fresh preview and memory stays bounded.
+        mtime is the one _row_for() read from the model, so no stat happens here.
+        Missing previews are decoded on the thread pool and the row at index (or the
+        whole view) is repainted once they arrive, so paint() never blocks on image I/O.
+        """
+        key = f"{file_path}@{mtime}@{size}"
+        cached = QPixmap()
+        if QPixmapCache.find(key, cached):
+            return cached
         
-        try:
-            pixmap = QPixmap(file_path)
-            if not pixmap.isNull():
-                # Scale to fit in icon_size while maintaining aspect ratio
-                scaled_pixmap = pixmap.scaledToWidth(size, Qt.SmoothTransformation)
-                if scaled_pixmap.height() > size:
-                    scaled_pixmap = scaled_pixmap.scaledToHeight(size, Qt.SmoothTransformation)
-                self.preview_cache[file_path] = scaled_pixmap
-                return scaled_pixmap
-        except Exception:
-            pass
+        # Scrolling: settle for a quick, rough preview until the view is idle again
+        fast_key = key + "@fast"
+        has_fast = QPixmapCache.find(fast_key, cached)
+        if not self._scrolling:
+            self._request_preview(key, file_path, size, Qt.SmoothTransformation, index)
+        elif not has_fast:
+            self._request_preview(fast_key, file_path, size, Qt.FastTransformation, index)
         
-        return None
+        # A fast preview stands in until the smooth one is ready
+        return cached if has_fast else None
+
+    def _request_preview(self, key: str, file_path: str, size: int, transformation, index=None):
+        """Queue a preview for decoding unless it is already on its way."""
+        if key in self._requested_previews:
+            return
+        self._requested_previews[key] = QPersistentModelIndex(index) if index is not None else None
+        QThreadPool.globalInstance().start(
+            _PreviewLoader(self._preview_signals, key, file_path, size, transformation))
+
+    def _on_preview_loaded(self, key: str, image: QImage):
+        """Cache a decoded preview (GUI thread) and repaint the row that asked for it."""
+        if image.isNull():
+            # Undecodable: leave the key requested so it isn't retried every paint
+            self._requested_previews[key] = None
+            return
+        index = self._requested_previews.pop(key, None)
+        QPixmapCache.insert(key, QPixmap.fromImage(image))
+        if index is not None and index.isValid():
+            self.parent().update(index.model().index(index.row(), index.column(), index.parent()))
+        else:
+            self.parent().viewport().update()
+
+    def _on_scroll(self, value: int):
+        """Mark the view as scrolling until it has been idle for SCROLL_IDLE_MS."""
+        self._scrolling = True
+        self._scroll_idle.start()
+
+    def _on_scroll_idle(self):
+        """Scrolling stopped: repaint so visible rows pick up smooth previews."""
+        self._scrolling = False
+        self.parent().viewport().update()
 
     def sizeHint(self, option, index):
         return QSize(200, 64)
@@ -191,23 +462,20 @@ class FileItemDelegate(QStyledItemDelegate):
             # Check if click is on the icon
             if icon_rect.contains(event.position().toPoint()):
                 # Click is on icon — toggle disable/enable
+                path = None
                 try:
                     # Handle nested proxy models: map through all layers
-                    current_index = index
-                    current_model = model
-                    while isinstance(current_model, QSortFilterProxyModel):
-                        current_index = current_model.mapToSource(current_index)
-                        current_model = current_model.sourceModel()
-                    
+                    current_model, current_index = self._to_source(index)
                     path = current_model.filePath(current_index)
                     
                     ModInfo(path).toggle()
+                    self.invalidate_path(path)
                     
                     # Trigger refresh if FileManager reference is available
                     if hasattr(self, 'file_manager'):
                         self.file_manager.refresh()
-                except Exception as e:
-                    print(f"Error renaming: {e}")
+                except Exception:
+                    log.exception("toggle %s failed", path)
                 return True
             else:
                 # Click outside icon — ensure item is selected
@@ -1,11 +1,29 @@
 import os
+import logging
 
 from PySide6.QtCore import QFileInfo, QDir
 
+log = logging.getLogger(__name__)
+
+
+def is_disabled_name(name: str) -> bool:
+    """Whether a file name marks a disabled mod (case-insensitive "disabled" prefix)."""
+    return name[:8].lower() == "disabled"
+
+
+def enabled_name(name: str) -> str:
+    """The file name without its disabled prefix and surrounding underscores."""
+    return (name[8:] if is_disabled_name(name) else name).strip("_")
+
+
 class ModInfo(QFileInfo):
 
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._name = os.path.basename(path)
+
     def isDisabled(self):
-        return self.fileName().lower().startswith("disabled")
+        return is_disabled_name(self._name)
     
     def toggle(self):
         old_path = self.filePath()
@@ -13,10 +31,15 @@ class ModInfo(QFileInfo):
         new_name = old_name[8:].strip("_") if self.isDisabled() else f"DISABLED_{old_name}"
         new_path = QDir(self.absolutePath()).filePath(new_name)
 
+        # os.replace() overwrites silently; never clobber a sibling with the target name
+        if os.path.exists(new_path):
+            log.error("rename %s -> %s failed: destination exists", old_path, new_path)
+            return
+
         try:
-            os.rename(old_path, new_path)
-        except:
-            print("couldn't rename, idk why")
+            os.replace(old_path, new_path)
+        except OSError as e:
+            log.error("rename %s -> %s failed: %s", old_path, new_path, e)
 
     def enabledName(self):
-        return self.fileName()[8 if self.isDisabled() else 0:].strip("_")
\ No newline at end of file
+        return enabled_name(self._name)
@@ -1,40 +1,133 @@
 import os
+import logging
 
-from PySide6.QtCore import QSortFilterProxyModel
+from PySide6.QtCore import Qt, QSortFilterProxyModel, QTimer
 
-from ModInfo import ModInfo
 from TagManager import TagManager
+from ModInfo import enabled_name
+
+log = logging.getLogger(__name__)
 
 
 class ModInfoSortProxyModel(QSortFilterProxyModel):
     """Custom sort proxy that sorts by ModInfo.enabledName()."""
     
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # path -> position of its sort key among its siblings, so lessThan
+        # compares two ints instead of keying both paths on every comparison
+        self._rank_by_path: dict[str, int] = {}
+    
+    @staticmethod
+    def _key_signals(model) -> list:
+        """Source model signals after which cached sort ranks may be stale."""
+        signals = [model.rowsInserted, model.rowsRemoved, model.dataChanged]
+        if hasattr(model, 'directoryLoaded'):  # QFileSystemModel
+            signals.append(model.directoryLoaded)
+        return signals
+    
+    def setSourceModel(self, source_model):
+        """Set the source model and drop cached sort ranks whenever its rows change."""
+        old_model = self.sourceModel()
+        if old_model is not None:
+            for signal in self._key_signals(old_model):
+                signal.disconnect(self._invalidate_keys)
+        super().setSourceModel(source_model)
+        self._rank_by_path.clear()
+        if source_model is not None:
+            for signal in self._key_signals(source_model):
+                signal.connect(self._invalidate_keys)
+    
+    def _invalidate_keys(self, *args):
+        self._rank_by_path.clear()
+    
+    def invalidate(self):
+        """Invalidate sorting and filtering, including the cached sort ranks."""
+        self._rank_by_path.clear()
+        super().invalidate()
+    
+    def sort(self, column: int, order=Qt.AscendingOrder):
+        """Sort with freshly computed ranks."""
+        self._rank_by_path.clear()
+        super().sort(column, order)
+    
+    @staticmethod
+    def _sort_key(path: str) -> str:
+        """Lowercased ModInfo.enabledName() of path."""
+        # A pure string rule on the basename, no QFileInfo needed
+        return enabled_name(path.rsplit("/", 1)[-1]).lower()
+    
+    def _rank_children(self, parent):
+        """Key all children of parent in one pass and rank them with a single sort."""
+        source_model = self.sourceModel()
+        keyed = sorted(
+            (self._sort_key(path), path)
+            for path in (source_model.filePath(source_model.index(row, 0, parent))
+                         for row in range(source_model.rowCount(parent))))
+        rank, previous = -1, None
+        for key, path in keyed:
+            if key != previous:  # equal keys share a rank, so ties stay ties
+                rank, previous = rank + 1, key
+            self._rank_by_path[path] = rank
+    
+    def _rank(self, index) -> int:
+        path = self.sourceModel().filePath(index)
+        rank = self._rank_by_path.get(path)
+        if rank is None:
+            # New or renamed row: re-rank its siblings
+            self._rank_children(index.parent())
+            rank = self._rank_by_path.get(path, -1)
+        return rank
+    
     def lessThan(self, left, right):
-        left_path = self.sourceModel().filePath(left)
-        right_path = self.sourceModel().filePath(right)
-        
-        left_info = ModInfo(left_path)
-        right_info = ModInfo(right_path)
-        
-        left_name = left_info.enabledName()
-        right_name = right_info.enabledName()
-        
-        return left_name.lower() < right_name.lower()
+        return self._rank(left) < self._rank(right)
+
+
+class DirectoryFilterProxyModel(QSortFilterProxyModel):
+    """Filter proxy that only lets directories through, for the folder tree."""
+    
+    def filterAcceptsRow(self, source_row: int, source_parent) -> bool:
+        source_model = self.sourceModel()
+        return source_model.isDir(source_model.index(source_row, 0, source_parent))
 
 
-class SearchFilterProxyModel(QSortFilterProxyModel):
-    """Custom filter proxy that filters by name or tag."""
+class SearchFilterProxyModel(ModInfoSortProxyModel):
+    """Sort proxy that additionally filters by name or tag, directly over a QFileSystemModel."""
+    
+    SEARCH_DEBOUNCE_MS = 120
     
     def __init__(self, tag_manager: TagManager = None):
         super().__init__()
         self.tag_manager = tag_manager
         self.search_text = ""
         self.root_path = ""
+        # path -> lowercased basename
+        self._name_index: dict[str, str] = {}
+        # Normalized paths whose tags match search_text, computed once per search
+        self._tag_matches: set[str] = set()
+        if tag_manager:
+            tag_manager.add_listener(self.invalidate_path)
+        # Coalesce rapid keystrokes into a single filter pass
+        self._pending_text = ""
+        self._debounce = QTimer(singleShot=True)
+        self._debounce.timeout.connect(self._apply_filter)
     
     def set_search_text(self, text: str):
-        """Set the search text and trigger filter update."""
-        self.search_text = text.lower()
-        # Invalidate filter to re-evaluate all rows
+        """Set the search text and schedule a filter update.
+
+        Clearing the search applies immediately so navigation never sees a stale filter.
+        """
+        self._pending_text = text.lower()
+        if self._pending_text:
+            self._debounce.start(self.SEARCH_DEBOUNCE_MS)
+        else:
+            self._debounce.stop()
+            self._apply_filter()
+    
+    def _apply_filter(self):
+        """Apply the pending search text and re-evaluate all rows."""
+        self.search_text = self._pending_text
+        self._update_tag_matches()
         try:
             self.invalidateFilter()
         except AttributeError:
@@ -45,7 +138,8 @@ class SearchFilterProxyModel(QSortFilterProxyModel):
     def set_root_path(self, path: str):
         """Set the root path for filtering."""
         self.root_path = os.path.normpath(path)
-        print(f"DEBUG: SearchFilterProxyModel.set_root_path called with path={path}, normalized={self.root_path}")
+        self._name_index.clear()
+        log.debug("SearchFilterProxyModel.set_root_path called with path=%s, normalized=%s", path, self.root_path)
         # Invalidate filter to re-evaluate rows with new root path
         try:
             self.invalidateFilter()
@@ -54,54 +148,49 @@ class SearchFilterProxyModel(QSortFilterProxyModel):
             self.beginFilterChange()
             self.endFilterChange()
     
+    def _update_tag_matches(self):
+        """Recompute which paths match the current search text by tag."""
+        if self.search_text and self.tag_manager:
+            self._tag_matches = self.tag_manager.paths_matching(self.search_text)
+        else:
+            self._tag_matches = set()
+    
+    def invalidate_path(self, path: str):
+        """The tags of path changed: refresh the tag matches of the current search."""
+        self._update_tag_matches()
+    
+    def _lowered_name(self, file_path: str) -> str:
+        """Lowercased basename of file_path, computed once per path."""
+        name = self._name_index.get(file_path)
+        if name is None:
+            name = self._name_index[file_path] = os.path.basename(file_path).lower()
+        return name
+    
     def filterAcceptsRow(self, source_row: int, source_parent) -> bool:
         """Check if row should be visible based on search text."""
         # If no search text, show all rows
         if not self.search_text:
             return True
         
-        # Get the direct source model (ModInfoSortProxyModel)
-        sort_proxy = self.sourceModel()
-        
-        # Create index in sort proxy space
-        sort_proxy_index = sort_proxy.index(source_row, 0, source_parent)
-        if not sort_proxy_index.isValid():
-            return True
-        
-        # Map through sort proxy to reach the actual QFileSystemModel
-        file_model_index = sort_proxy.mapToSource(sort_proxy_index)
+        # Get file path from the QFileSystemModel
+        file_system_model = self.sourceModel()
+        file_model_index = file_system_model.index(source_row, 0, source_parent)
         if not file_model_index.isValid():
             return True
         
-        # Get the actual file system model
-        file_system_model = sort_proxy.sourceModel()
-        
-        # Get file path from QFileSystemModel
         if not hasattr(file_system_model, 'filePath'):
-            print(f"DEBUG: Model {file_system_model} doesn't have filePath method")
+            log.debug("Model %s doesn't have filePath method", file_system_model)
             return True
         
-       
         file_path = file_system_model.filePath(file_model_index)
-        print(f"DEBUG: Checking file_path={file_path}, search_text={self.search_text}")
-        
         if not file_path:
             return True
         
         # Check if filename contains search text
-        file_name = os.path.basename(file_path).lower()
-        search_lower = self.search_text.lower()
-        
-        if search_lower in file_name:
-            print(f"DEBUG: Name match! {file_name} contains {search_lower}")
+        if self.search_text in self._lowered_name(file_path):
             return True
         
-        # Check if any tag contains search text
-        if self.tag_manager:
-            tags = self.tag_manager.get_tags(file_path)
-            for tag in tags:
-                if search_lower in tag.lower():
-                    print(f"DEBUG: Tag match! {tag} contains {search_lower}")
-                    return True
-        
-        return False
\ No newline at end of file
+        # Check if any tag contains search text; skip normalizing when no tag matches at all
+        if not self._tag_matches:
+            return False
+        return self.tag_manager.normalize(file_path) in self._tag_matches
@@ -1,62 +1,212 @@
 import os
-import json
+import atexit
+import logging
+import contextlib
+from collections import OrderedDict
+
+import orjson
+from PySide6.QtCore import QTimer
+
+log = logging.getLogger(__name__)
 
 class TagManager:
     """Manages tags stored in a JSON file."""
     
     TAGS_FILE = ".tags.json"
+    SAVE_DELAY_MS = 250
+    NORM_CACHE_SIZE = 10000
     
     def __init__(self, base_dir: str = None):
         self.base_dir = base_dir or os.path.expanduser("~")
         self.tags_path = os.path.join(self.base_dir, self.TAGS_FILE)
+        self._norm_cache: OrderedDict[str, str] = OrderedDict()
         self.tags = self._load_tags()
+        self._listeners = []
+        
+        # Secondary indexes, kept in step with self.tags by _store():
+        # parent directory -> tagged paths directly inside it, and
+        # tag -> paths carrying it (plus each such tag lowercased, for searching).
+        self._by_dir: dict[str, set[str]] = {}
+        self._tag_to_paths: dict[str, set[str]] = {}
+        self._lower_tag_cache: dict[str, str] = {}
+        for normalized_path, tags in self.tags.items():
+            self._index(normalized_path, tags)
+        
+        # Writes are batched: mutators mark the store dirty and a single-shot
+        # timer flushes it, so N quick edits cost one file rewrite.
+        self._dirty = False
+        # Inside batch(): nesting depth, and the paths whose listeners are still owed a call
+        self._batch_depth = 0
+        self._batched_paths: set[str] = set()
+        self._save_timer = QTimer(singleShot=True, interval=self.SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self._flush)
+        atexit.register(self._flush)
     
     def _load_tags(self) -> dict:
-        """Load tags from JSON file."""
+        """Load tags from JSON file.
+
+        Tag lists are held as tuples, so get_tags() hands out the same object
+        until the tags of that path change.
+        """
         if os.path.exists(self.tags_path):
             try:
-                with open(self.tags_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(self.tags_path, 'rb') as f:
+                    return {path: tuple(tags) for path, tags in orjson.loads(f.read()).items()}
             except Exception as e:
-                print(f"Error loading tags: {e}")
+                log.error("Error loading tags: %s", e)
         return {}
     
     def _save_tags(self):
-        """Save tags to JSON file."""
+        """Save tags to JSON file, atomically replacing the previous one."""
+        tmp_path = self.tags_path + ".tmp"
         try:
-            with open(self.tags_path, 'w', encoding='utf-8') as f:
-                json.dump(self.tags, f, indent=2, ensure_ascii=False)
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(self.tags, option=orjson.OPT_INDENT_2))
+            os.replace(tmp_path, self.tags_path)
         except Exception as e:
-            print(f"Error saving tags: {e}")
+            log.error("Error saving tags: %s", e)
+    
+    def _mark_dirty(self):
+        """Schedule a save of the tags file."""
+        self._dirty = True
+        if not self._batch_depth:
+            self._save_timer.start()
+    
+    def _flush(self):
+        """Write pending tag changes to disk, if any."""
+        if self._dirty:
+            self._dirty = False
+            self._save_tags()
+    
+    def normalize(self, file_path: str) -> str:
+        """Normalize a path the way tag keys are stored (memoized os.path.normpath())."""
+        normalized_path = self._norm_cache.get(file_path)
+        if normalized_path is None:
+            normalized_path = os.path.normpath(file_path)
+            self._norm_cache[file_path] = normalized_path
+            if len(self._norm_cache) > self.NORM_CACHE_SIZE:
+                self._norm_cache.popitem(last=False)
+        return normalized_path
+    
+    def add_listener(self, callback):
+        """Register callback(file_path) to be called whenever a path's tags change."""
+        self._listeners.append(callback)
+    
+    def _notify(self, file_path: str):
+        """Tell listeners that the tags of file_path changed."""
+        if self._batch_depth:
+            self._batched_paths.add(file_path)
+            return
+        for callback in self._listeners:
+            callback(file_path)
+    
+    @contextlib.contextmanager
+    def batch(self):
+        """Group several tag changes into one save and one notification per path.
+
+        Usage: ``with tag_manager.batch(): ...``. Batches may be nested; the
+        outermost one schedules the save and notifies listeners when it exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                paths, self._batched_paths = self._batched_paths, set()
+                for file_path in paths:
+                    self._notify(file_path)
+                if self._dirty:
+                    self._save_timer.start()
+    
+    def _index(self, normalized_path: str, tags: tuple):
+        """Add a path to the secondary indexes."""
+        self._by_dir.setdefault(os.path.dirname(normalized_path), set()).add(normalized_path)
+        for tag in tags:
+            self._tag_to_paths.setdefault(tag, set()).add(normalized_path)
+    
+    def _unindex(self, normalized_path: str, tags: tuple):
+        """Remove a path (currently carrying tags) from the secondary indexes."""
+        parent = os.path.dirname(normalized_path)
+        siblings = self._by_dir.get(parent)
+        if siblings is not None:
+            siblings.discard(normalized_path)
+            if not siblings:
+                del self._by_dir[parent]
+        for tag in tags:
+            paths = self._tag_to_paths.get(tag)
+            if paths is not None:
+                paths.discard(normalized_path)
+                if not paths:
+                    del self._tag_to_paths[tag]
+                    self._lower_tag_cache.pop(tag, None)
     
-    def get_tags(self, file_path: str) -> list:
-        """Get tags for a file/folder."""
-        normalized_path = os.path.normpath(file_path)
-        return self.tags.get(normalized_path, [])
+    def _store(self, normalized_path: str, tags: tuple):
+        """Set (or, if tags is empty, clear) the tags of a path and update the indexes."""
+        old_tags = self.tags.get(normalized_path)
+        if old_tags is not None:
+            self._unindex(normalized_path, old_tags)
+        if tags:
+            self.tags[normalized_path] = tags
+            self._index(normalized_path, tags)
+        elif old_tags is not None:
+            del self.tags[normalized_path]
+    
+    def get_tags(self, file_path: str) -> tuple:
+        """Get tags for a file/folder.
+
+        Served from memory: the tags file is read once at startup, and lookups
+        are a memoized normalize() plus a dict hit returning the stored tuple.
+        """
+        return self.tags.get(self.normalize(file_path), ())
+    
+    def paths_matching(self, substring: str) -> set:
+        """Get the normalized paths with at least one tag containing substring (case-insensitive).
+
+        Scans the set of distinct tags once, not every tagged path.
+        """
+        substring = substring.lower()
+        matches = set()
+        for tag, paths in self._tag_to_paths.items():
+            lowered = self._lower_tag_cache.get(tag)
+            if lowered is None:
+                lowered = self._lower_tag_cache[tag] = tag.lower()
+            if substring in lowered:
+                matches |= paths
+        return matches
+    
+    def iter_tagged_under(self, directory: str):
+        """Yield every tagged path inside directory, at any depth.
+
+        Only directories that contain tagged paths are visited, not every tagged path.
+        """
+        root = self.normalize(directory)
+        prefix = os.path.join(root, "")
+        for parent, paths in list(self._by_dir.items()):
+            if parent == root or parent.startswith(prefix):
+                yield from list(paths)
     
     def add_tag(self, file_path: str, tag: str):
         """Add a tag to a file/folder."""
-        normalized_path = os.path.normpath(file_path)
-        if normalized_path not in self.tags:
-            self.tags[normalized_path] = []
-        if tag not in self.tags[normalized_path]:
-            self.tags[normalized_path].append(tag)
-            self._save_tags()
+        normalized_path = self.normalize(file_path)
+        tags = self.tags.get(normalized_path, ())
+        if tag not in tags:
+            self._store(normalized_path, tags + (tag,))
+            self._mark_dirty()
+            self._notify(file_path)
     
     def remove_tag(self, file_path: str, tag: str):
         """Remove a tag from a file/folder."""
-        normalized_path = os.path.normpath(file_path)
-        if normalized_path in self.tags and tag in self.tags[normalized_path]:
-            self.tags[normalized_path].remove(tag)
-            if not self.tags[normalized_path]:  # Remove entry if no tags left
-                del self.tags[normalized_path]
-            self._save_tags()
+        normalized_path = self.normalize(file_path)
+        tags = self.tags.get(normalized_path, ())
+        if tag in tags:
+            # Entry is dropped if no tags are left
+            self._store(normalized_path, tuple(t for t in tags if t != tag))
+            self._mark_dirty()
+            self._notify(file_path)
     
     def set_tags(self, file_path: str, tags: list):
         """Set all tags for a file/folder."""
-        normalized_path = os.path.normpath(file_path)
-        if tags:
-            self.tags[normalized_path] = tags
-        elif normalized_path in self.tags:
-            del self.tags[normalized_path]
-        self._save_tags()
\ No newline at end of file
+        self._store(self.normalize(file_path), tuple(tags))
+        self._mark_dirty()
+        self._notify(file_path)
@@ -9,6 +9,11 @@ Run as a script to launch the GUI.
 
 import sys
 import os
+import errno
+import shutil
+import functools
+import ctypes
+import logging
 
 from PySide6.QtWidgets import (
     QApplication,
@@ -22,29 +27,163 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QInputDialog,
     QMenu,
+    QFileIconProvider,
+    QProgressBar,
 )
-from PySide6.QtCore import QDir, Qt, QUrl, QSize,  QFileInfo, QEvent, QSortFilterProxyModel
-from PySide6.QtGui import QDesktopServices, QAction,  QColor
+from PySide6.QtCore import QDir, Qt, QUrl, QSize, QEvent, QTimer, \
+    QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtGui import QDesktopServices, QAction,  QColor, QActionGroup
 
 
 from TagManager import TagManager
-from ProxyModels import ModInfoSortProxyModel, SearchFilterProxyModel
+from ProxyModels import ModInfoSortProxyModel, SearchFilterProxyModel, DirectoryFilterProxyModel
 from FileItemDelegate import FileItemDelegate
 
+log = logging.getLogger(__name__)
 
 
 
 
 
 
+
+# Filesystem root ("/" or the system drive), never a valid cut/copy/delete target
+_ROOT_PATH = QDir.rootPath()
+
+# shutil.copy2() already copies through os.sendfile() on Linux, fcopyfile() on macOS
+# and CopyFile2 on Windows from Python 3.12; older Windows builds copy in user space
+_USE_COPYFILEW = sys.platform == "win32" and sys.version_info < (3, 12)
+
+
+def _fast_copy2(src: str, dst: str):
+    """shutil.copy2() for file paths, letting the OS copy the data on older Windows Pythons."""
+    if not _USE_COPYFILEW:
+        return shutil.copy2(src, dst)
+    if not ctypes.windll.kernel32.CopyFileW(src, dst, False):
+        raise ctypes.WinError()
+    shutil.copystat(src, dst)
+    return dst
+
+
+def _link_or_copy(src: str, dst: str):
+    """Hard-link dst to src (metadata only, no data copied); copy where linking fails."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        _fast_copy2(src, dst)
+    return dst
+
+
+def _merge_conflicts(src: str, dst: str):
+    """Yield the paths under dst that are a file where src has a folder, or the other way round."""
+    with os.scandir(src) as it:
+        entries = list(it)
+    for entry in entries:
+        target = os.path.join(dst, entry.name)
+        if not os.path.lexists(target):
+            continue
+        is_dir = entry.is_dir()
+        if is_dir != os.path.isdir(target):
+            yield target
+        elif is_dir:
+            yield from _merge_conflicts(entry.path, target)
+
+
+def _merge_tree(src: str, dst: str, copy_function):
+    """Copy the tree at src into dst, skipping files that are already there."""
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as it:
+        entries = list(it)
+    for entry in entries:
+        target = os.path.join(dst, entry.name)
+        if entry.is_dir():
+            _merge_tree(entry.path, target, copy_function)
+            continue
+        st = entry.stat()
+        try:
+            target_st = os.stat(target)
+        except FileNotFoundError:
+            pass
+        else:
+            if target_st.st_size == st.st_size and target_st.st_mtime_ns == st.st_mtime_ns:
+                continue
+        copy_function(entry.path, target)
+    # Like copytree(), directories get their metadata after their contents
+    shutil.copystat(src, dst)
+
+
+def _sync_tree(src: str, dst: str, copy_function):
+    """Copy the tree at src into the existing dst, skipping files that are already there.
+
+    A file counts as already there if the destination has the same size and
+    modification time; copy2() and hard links preserve both, so pasting the same
+    folder again only copies what changed since. Files that differ are
+    overwritten. If a file in one tree is a folder in the other, nothing is
+    copied and FileExistsError lists the conflicts.
+    """
+    conflicts = list(_merge_conflicts(src, dst))
+    if conflicts:
+        shown = ", ".join(conflicts[:5]) + (f" and {len(conflicts) - 5} more" if len(conflicts) > 5 else "")
+        raise FileExistsError(errno.EEXIST, f"File/folder type conflicts, nothing copied: {shown}")
+    _merge_tree(src, dst, copy_function)
+
+
+def _copy_path(src: str, dst: str, copy_function):
+    """Copy a file, or a directory tree, from src to dst with copy_function per file.
+
+    A directory pasted over an existing one is merged into it incrementally.
+    """
+    if not os.path.isdir(src):
+        copy_function(src, dst)
+    elif os.path.isdir(dst):
+        _sync_tree(src, dst, copy_function)
+    else:
+        shutil.copytree(src, dst, copy_function=copy_function)
+
+
+class _FileOpSignals(QObject):
+    """Carries file operation results (operation, src, dst[, error]) from pool threads to the GUI thread."""
+    finished = Signal(str, str, str)
+    failed = Signal(str, str, str, str)
+
+
+class _FileOpWorker(QRunnable):
+    """Runs one long file operation ("copy", "move" or "delete") off the GUI thread.
+
+    function is called without arguments; the outcome is reported through
+    _FileOpSignals together with operation, src and dst ("" if there is none).
+    """
+
+    def __init__(self, signals: _FileOpSignals, operation: str, src: str, dst: str, function):
+        super().__init__()
+        self.signals = signals
+        self.operation = operation
+        self.src = src
+        self.dst = dst
+        self.function = function
+
+    def run(self):
+        try:
+            self.function()
+        except Exception as e:
+            self.signals.failed.emit(self.operation, self.src, self.dst, str(e))
+            return
+        self.signals.finished.emit(self.operation, self.src, self.dst)
+
+
 class FileManager(QMainWindow):
     """Main application window.
 
     - Left: `QTreeView` with directories
     - Right: `QListView` displaying files using `QFileSystemModel` and the
         `FileItemDelegate` for custom rendering.
+
+    With hardlink_on_copy (the "Hard-link copies" toolbar toggle, or
+    SELECTR_HARDLINK_ON_COPY=1 at startup), pasting a copy on the same
+    filesystem creates hard links instead of duplicating file contents. Linked
+    files share their data, so editing one changes the other.
     """
-    def __init__(self, root_path: str):
+    def __init__(self, root_path: str, hardlink_on_copy: bool = False):
         super().__init__()
         self.setWindowTitle("Simple PySide6 File Manager")
         self.resize(900, 600)
@@ -52,19 +191,22 @@ class FileManager(QMainWindow):
         # Initialize tag manager
         self.tag_manager = TagManager(root_path)
 
-        # Models
-        self.dir_model = QFileSystemModel()
-        self.dir_model.setFilter(QDir.AllDirs | QDir.NoDotAndDotDot)
-        self.dir_model.setRootPath(QDir.rootPath())
-
+        # Models: the tree and the left list share one QFileSystemModel (one
+        # watcher, one stat cache); all models use the same icon provider
+        self.icon_provider = QFileIconProvider()
         self.file_model = QFileSystemModel()
+        self.file_model.setIconProvider(self.icon_provider)
         self.file_model.setFilter(QDir.AllEntries | QDir.NoDotAndDotDot)
         self.file_model.setRootPath(QDir.rootPath())
 
+        # The tree only shows directories
+        self.dir_model = DirectoryFilterProxyModel()
+        self.dir_model.setSourceModel(self.file_model)
+
         # Views
         self.tree = QTreeView()
         self.tree.setModel(self.dir_model)
-        self.tree.setRootIndex(self.dir_model.index(root_path))
+        self.tree.setRootIndex(self.dir_model.mapFromSource(self.file_model.index(root_path)))
         self.tree.setHeaderHidden(True)
         for i in range(1, 4):
             self.tree.hideColumn(i)
@@ -74,24 +216,22 @@ class FileManager(QMainWindow):
         self.list.setRootIndex(self.file_model.index(root_path))
         self.list.setViewMode(QListView.ListMode)
         
-        # Apply custom sort proxy to sort by ModInfo.enabledName()
-        self.proxy_model = ModInfoSortProxyModel()
-        self.proxy_model.setSourceModel(self.file_model)
-        self.proxy_model.setDynamicSortFilter(True)
-        self.proxy_model.sort(0, Qt.AscendingOrder)
-        
-        # Apply search filter proxy on top of sort proxy
+        # One proxy both sorts by ModInfo.enabledName() and applies the search filter
         self.search_proxy_model = SearchFilterProxyModel(self.tag_manager)
-        self.search_proxy_model.setSourceModel(self.proxy_model)
+        self.search_proxy_model.setSourceModel(self.file_model)
         self.search_proxy_model.setDynamicSortFilter(True)
+        self.search_proxy_model.sort(0, Qt.AscendingOrder)
         
         self.list.setModel(self.search_proxy_model)
-        self.list.setRootIndex(self.search_proxy_model.mapFromSource(self.proxy_model.mapFromSource(self.file_model.index(root_path))))
+        self.list.setRootIndex(self.search_proxy_model.mapFromSource(self.file_model.index(root_path)))
         
         # Use custom delegate to render each entry
-        delegate = FileItemDelegate(self.list, self.tag_manager)
-        delegate.file_manager = self  # Pass reference to FileManager for refresh
-        self.list.setItemDelegate(delegate)
+        self.delegate = FileItemDelegate(
+            self.list, self.tag_manager, self.file_model,
+            self.search_proxy_model.mapToSource,
+            self.icon_provider)
+        self.delegate.file_manager = self  # Pass reference to FileManager for refresh
+        self.list.setItemDelegate(self.delegate)
         self.list.setIconSize(QSize(48, 48))
         try:
             # spacing exists on QListView
@@ -126,6 +266,12 @@ class FileManager(QMainWindow):
         open_action.triggered.connect(self.open_selected)
         toolbar.addAction(open_action)
 
+        hardlink_action = QAction("Hard-link copies", self)
+        hardlink_action.setCheckable(True)
+        hardlink_action.setChecked(hardlink_on_copy)
+        hardlink_action.toggled.connect(self.set_hardlink_on_copy)
+        toolbar.addAction(hardlink_action)
+
         
         toolbar.addSeparator()
         self.search_edit = QLineEdit()
@@ -169,8 +315,11 @@ class FileManager(QMainWindow):
         self.right_path_edit = QLineEdit()
         self.right_path_edit.returnPressed.connect(self.right_goto_path)
         
-        # Right view list
+        # Right view list. It keeps its own model: QFileSystemModel always lists the
+        # ancestors of a loaded path, so sharing would surface the right panel's
+        # (often hidden) directories in the tree and the left list.
         self.right_file_model = QFileSystemModel()
+        self.right_file_model.setIconProvider(self.icon_provider)
         self.right_file_model.setFilter(QDir.AllEntries | QDir.NoDotAndDotDot)
         self.right_file_model.setRootPath(QDir.rootPath())
         
@@ -186,15 +335,25 @@ class FileManager(QMainWindow):
         self.right_list.setModel(self.right_proxy_model)
         
         # Right list delegate
-        right_delegate = FileItemDelegate(self.right_list, self.tag_manager)
-        right_delegate.file_manager = self
-        self.right_list.setItemDelegate(right_delegate)
+        self.right_delegate = FileItemDelegate(
+            self.right_list, self.tag_manager, self.right_file_model, self.right_proxy_model.mapToSource,
+            self.icon_provider)
+        self.right_delegate.file_manager = self
+        self.right_list.setItemDelegate(self.right_delegate)
         self.right_list.setIconSize(QSize(48, 48))
         try:
             self.right_list.setSpacing(6)
         except Exception:
             pass
         
+        # Per list view: its proxies (outermost first), the file model underneath
+        # them and its path bar; built once so resolving a row is a plain loop
+        # over mapToSource() and no method branches on which panel it serves
+        self._view_registry = {
+            self.list: ([self.search_proxy_model], self.file_model, self.path_edit),
+            self.right_list: ([self.right_proxy_model], self.right_file_model, self.right_path_edit),
+        }
+        
         # Right view history
         self.right_history = []
         self.right_history_index = -1
@@ -237,6 +396,12 @@ class FileManager(QMainWindow):
         # Clipboard for cut/copy/paste
         self.clipboard_path = None
         self.clipboard_mode = None  # "cut" or "copy"
+        self.clipboard_name = None  # file name of clipboard_path, taken once at cut/copy time
+        self.hardlink_on_copy = hardlink_on_copy
+        # Panels waiting for a refresh scheduled by _schedule_refresh()
+        self._refresh_pending_left = False
+        self._refresh_pending_right = False
+        self._refresh_scheduled = False
         self.focused_list = self.list  # Track which list is focused
         
         # Status bar for clipboard display
@@ -244,8 +409,25 @@ class FileManager(QMainWindow):
         self.clipboard_label = QLineEdit()
         self.clipboard_label.setReadOnly(True)
         self.clipboard_label.setText("Clipboard: empty")
+        self._last_clipboard_text = "Clipboard: empty"
         self.status_bar.addWidget(self.clipboard_label)
 
+        # Copies, cross-filesystem moves and recursive deletes run on their own
+        # small pool, so a long one neither freezes the window nor holds up the
+        # delegates' preview decoding on the global pool; a busy indicator shows
+        # while any is running
+        self._file_op_pool = QThreadPool(self)
+        self._file_op_pool.setMaxThreadCount(2)
+        self._file_op_signals = _FileOpSignals(self)
+        self._file_op_signals.finished.connect(self._on_file_op_finished)
+        self._file_op_signals.failed.connect(self._on_file_op_failed)
+        self._active_file_ops = 0
+        self.file_op_progress = QProgressBar()
+        self.file_op_progress.setRange(0, 0)
+        self.file_op_progress.setMaximumWidth(120)
+        self.file_op_progress.hide()
+        self.status_bar.addPermanentWidget(self.file_op_progress)
+
         # install event filter to catch mouse back/forward buttons
         self.list.viewport().installEventFilter(self)
         self.tree.viewport().installEventFilter(self)
@@ -276,11 +458,10 @@ class FileManager(QMainWindow):
         self.search_proxy_model.set_root_path(path)
         
         dir_index = self.file_model.index(path)
-        tree_index = self.dir_model.index(path)
+        tree_index = self.dir_model.mapFromSource(dir_index)
         if dir_index.isValid():
             # Map source index through both proxy models for the list
-            sort_proxy_index = self.proxy_model.mapFromSource(dir_index)
-            search_proxy_index = self.search_proxy_model.mapFromSource(sort_proxy_index)
+            search_proxy_index = self.search_proxy_model.mapFromSource(dir_index)
             self.list.setRootIndex(search_proxy_index)
         if tree_index.isValid():
             self.tree.setCurrentIndex(tree_index)
@@ -295,28 +476,24 @@ class FileManager(QMainWindow):
                 self.history_index = len(self.history) - 1
 
     def on_tree_selection_changed(self, current, previous):
-        path = self.dir_model.filePath(current)
+        path = self.file_model.filePath(self.dir_model.mapToSource(current))
         if path:
             self.set_path(path, add_history=True)
 
     def on_list_double_clicked(self, index):
-        # Map through both proxy models to get to source
         # index comes from search_proxy_model
-        sort_proxy_index = self.search_proxy_model.mapToSource(index)
-        source_index = self.proxy_model.mapToSource(sort_proxy_index)
+        source_index = self.search_proxy_model.mapToSource(index)
         path = self.file_model.filePath(source_index)
-        info = QFileInfo(path)
-        if info.exists():
-            # navigate into directories
-            if info.isDir():
-                self.set_path(path, add_history=True)
-                return
+        # navigate into directories
+        if os.path.isdir(path):
+            self.set_path(path, add_history=True)
+            return
         # try to open files with default app
         QDesktopServices.openUrl(QUrl.fromLocalFile(path))
 
     def goto_path(self):
         path = self.path_edit.text().strip()
-        if not QDir(path).exists():
+        if not os.path.isdir(path):
             QMessageBox.warning(self, "Not found", f"Path not found: {path}")
             return
         self.set_path(path)
@@ -355,22 +532,52 @@ class FileManager(QMainWindow):
         return super().eventFilter(watched, event)
 
     def refresh(self):
-        # Refresh models by resetting root paths
+        # The file model watches its directories itself; resetting its root path
+        # would rebuild every node and icon, so only re-run the proxies and drop
+        # the cached rows of this directory
         cur = self.path_edit.text()
-        self.file_model.setRootPath("")
-        self.dir_model.setRootPath("")
-        self.file_model.setRootPath(cur)
-        self.dir_model.setRootPath(cur)
+        self.delegate.invalidate_dir(cur)
+        self._load_directory(self.file_model, cur)
+        self.search_proxy_model.invalidate()
+
+    @staticmethod
+    def _load_directory(model: QFileSystemModel, path: str):
+        """Make model list path's entries, fetching only that directory if it isn't yet."""
+        index = model.index(path)
+        if index.isValid() and model.canFetchMore(index):
+            model.fetchMore(index)
+
+    def _schedule_refresh(self, *paths):
+        """Refresh, once on the next event loop pass, every panel showing any of paths.
+
+        A panel counts as showing a path if its directory is the path or one of its
+        ancestors; without paths both panels are refreshed. Repeated requests before
+        the refresh runs are merged.
+        """
+        for path_edit, attr in ((self.path_edit, "_refresh_pending_left"),
+                                (self.right_path_edit, "_refresh_pending_right")):
+            directory = os.path.normpath(path_edit.text().strip())
+            prefix = os.path.join(directory, "")
+            if not paths or any(os.path.normpath(p) == directory or os.path.normpath(p).startswith(prefix)
+                                for p in paths):
+                setattr(self, attr, True)
+        if (self._refresh_pending_left or self._refresh_pending_right) and not self._refresh_scheduled:
+            self._refresh_scheduled = True
+            QTimer.singleShot(0, self._run_scheduled_refresh)
+
+    def _run_scheduled_refresh(self):
+        """Run the refreshes requested through _schedule_refresh()."""
+        left, right = self._refresh_pending_left, self._refresh_pending_right
+        self._refresh_scheduled = self._refresh_pending_left = self._refresh_pending_right = False
+        if left:
+            self.refresh()
+        if right:
+            self.right_refresh()
 
     def create_folder(self):
         """Create a new folder in the focused panel's current directory."""
-        # Determine which panel is focused
-        if self.list.hasFocus() or self.focused_list == self.list:
-            path = self.path_edit.text()
-        elif self.right_list.hasFocus():
-            path = self.right_path_edit.text()
-        else:
-            path = self.path_edit.text()
+        # The focused panel's directory, the left one if neither has focus
+        path = self._view_registry[self._focused_view() or self.list][2].text()
         
         name, ok = QInputDialog.getText(self, "New Folder", "Folder name:")
         if not ok or not name:
@@ -380,151 +587,106 @@ class FileManager(QMainWindow):
         if not qdir.mkdir(new_path):
             QMessageBox.warning(self, "Error", f"Could not create folder: {new_path}")
         else:
-            self.refresh()
-            self.right_refresh()
+            self._schedule_refresh(new_path)
+
+    def _focused_view(self):
+        """The list view file operations apply to, or None if neither panel has focus."""
+        if self.list.hasFocus() or self.focused_list == self.list:
+            return self.list
+        if self.right_list.hasFocus():
+            return self.right_list
+        return None
+
+    def _resolve_path(self, view, index):
+        """Map a row of view down to its file model; returns (path, source_model)."""
+        proxies, source_model, _ = self._view_registry[view]
+        for proxy in proxies:
+            index = proxy.mapToSource(index)
+        return source_model.filePath(index), source_model
+
+    def _focused_path_and_index(self):
+        """Return (path, view index, source_model) of the focused list's current row.
+
+        All three are None if no panel has focus.
+        """
+        view = self._focused_view()
+        if view is None:
+            return None, None, None
+        index = view.currentIndex()
+        path, source_model = self._resolve_path(view, index)
+        return path, index, source_model
 
     def delete_selected(self):
         """Delete selected file/folder from focused view."""
-        # Determine which list is focused
-        if self.list.hasFocus() or self.focused_list == self.list:
-            index = self.list.currentIndex()
-            # Map through nested proxy models for central view
-            current_index = index
-            current_model = self.search_proxy_model
-            while isinstance(current_model, QSortFilterProxyModel):
-                current_index = current_model.mapToSource(current_index)
-                current_model = current_model.sourceModel()
-            path = current_model.filePath(current_index)
-        elif self.right_list.hasFocus():
-            index = self.right_list.currentIndex()
-            current_index = index
-            current_model = self.right_proxy_model
-            while isinstance(current_model, QSortFilterProxyModel):
-                current_index = current_model.mapToSource(current_index)
-                current_model = current_model.sourceModel()
-            path = current_model.filePath(current_index)
-        else:
+        path, index, _ = self._focused_path_and_index()
+        if index is None or not index.isValid():
             return
         
-        if not index.isValid():
-            return
-        
-        if not path or path == QDir.rootPath():
+        if not path or path == _ROOT_PATH:
             return
         
         ok = QMessageBox.question(self, "Delete", f"Delete {path}?", QMessageBox.Yes | QMessageBox.No)
         if ok == QMessageBox.Yes:
-            info = QFileInfo(path)
-            if info.isDir():
-                qdir = QDir()
-                if not qdir.rmdir(path):
-                    QMessageBox.warning(self, "Error", "Could not remove directory (must be empty)")
+            if os.path.isdir(path):
+                try:
+                    with os.scandir(path) as it:
+                        empty = next(it, None) is None
+                    if empty:
+                        os.rmdir(path)
+                except OSError as e:
+                    QMessageBox.warning(self, "Error", f"Could not remove directory: {e}")
+                    return
+                if not empty:
+                    ok = QMessageBox.question(
+                        self, "Delete", f"{path} is not empty. Delete it and everything in it?",
+                        QMessageBox.Yes | QMessageBox.No)
+                    if ok == QMessageBox.Yes:
+                        # Panels refresh once the tree is gone
+                        self._start_file_op("delete", path, "", functools.partial(shutil.rmtree, path))
+                    return
             else:
-                import os
-
                 try:
                     os.remove(path)
                 except Exception as e:
                     QMessageBox.warning(self, "Error", f"Could not remove file: {e}")
-            self.refresh()
-            self.right_refresh()
+            self._schedule_refresh(path)
 
     def open_selected(self):
         """Open selected file/folder from focused view."""
-        # Determine which list is focused
-        if self.list.hasFocus() or self.focused_list == self.list:
-            index = self.list.currentIndex()
-            # Map through nested proxy models for central view
-            current_index = index
-            current_model = self.search_proxy_model
-            while isinstance(current_model, QSortFilterProxyModel):
-                current_index = current_model.mapToSource(current_index)
-                current_model = current_model.sourceModel()
-            path = current_model.filePath(current_index)
-        elif self.right_list.hasFocus():
-            index = self.right_list.currentIndex()
-            current_index = index
-            current_model = self.right_proxy_model
-            while isinstance(current_model, QSortFilterProxyModel):
-                current_index = current_model.mapToSource(current_index)
-                current_model = current_model.sourceModel()
-            path = current_model.filePath(current_index)
-        else:
-            return
-        
-        if not index.isValid():
+        path, index, _ = self._focused_path_and_index()
+        if index is None or not index.isValid():
             return
         
         QDesktopServices.openUrl(QUrl.fromLocalFile(path))
 
     def cut_selected(self):
         """Cut selected file/folder from focused view."""
-        # Determine which list is focused
-        if self.list.hasFocus() or self.focused_list == self.list:
-            index = self.list.currentIndex()
-            # Map through nested proxy models for central view
-            current_index = index
-            current_model = self.search_proxy_model
-            while isinstance(current_model, QSortFilterProxyModel):
-                current_index = current_model.mapToSource(current_index)
-                current_model = current_model.sourceModel()
-            path = current_model.filePath(current_index)
-        elif self.right_list.hasFocus():
-            index = self.right_list.currentIndex()
-            current_index = index
-            current_model = self.right_proxy_model
-            while isinstance(current_model, QSortFilterProxyModel):
-                current_index = current_model.mapToSource(current_index)
-                current_model = current_model.sourceModel()
-            path = current_model.filePath(current_index)
-        else:
-            return
-        
-        if not index.isValid():
+        path, index, _ = self._focused_path_and_index()
+        if index is None or not index.isValid():
             return
         
         # Verify we got a file/folder, not a directory root
-        if not path or path == QDir.rootPath():
+        if not path or path == _ROOT_PATH:
             return
         
         self.clipboard_path = path
         self.clipboard_mode = "cut"
-        file_name = QFileInfo(path).fileName()
+        self.clipboard_name = os.path.basename(path)
         self.update_clipboard_display()
 
     def copy_selected(self):
         """Copy selected file/folder from focused view."""
-        # Determine which list is focused
-        if self.list.hasFocus() or self.focused_list == self.list:
-            index = self.list.currentIndex()
-            # Map through nested proxy models for central view
-            current_index = index
-            current_model = self.search_proxy_model
-            while isinstance(current_model, QSortFilterProxyModel):
-                current_index = current_model.mapToSource(current_index)
-                current_model = current_model.sourceModel()
-            path = current_model.filePath(current_index)
-        elif self.right_list.hasFocus():
-            index = self.right_list.currentIndex()
-            current_index = index
-            current_model = self.right_proxy_model
-            while isinstance(current_model, QSortFilterProxyModel):
-                current_index = current_model.mapToSource(current_index)
-                current_model = current_model.sourceModel()
-            path = current_model.filePath(current_index)
-        else:
-            return
-        
-        if not index.isValid():
+        path, index, _ = self._focused_path_and_index()
+        if index is None or not index.isValid():
             return
         
         # Verify we got a file/folder, not a directory root
-        if not path or path == QDir.rootPath():
+        if not path or path == _ROOT_PATH:
             return
         
         self.clipboard_path = path
         self.clipboard_mode = "copy"
-        file_name = QFileInfo(path).fileName()
+        self.clipboard_name = os.path.basename(path)
         self.update_clipboard_display()
 
     def paste_selected(self):
@@ -533,57 +695,123 @@ class FileManager(QMainWindow):
             QMessageBox.warning(self, "Paste", "Nothing in clipboard")
             return
         
-        # Determine which list is focused for destination
-        if self.list.hasFocus() or self.focused_list == self.list:
-            current_path = self.path_edit.text().strip()
-        elif self.right_list.hasFocus():
-            current_path = self.right_path_edit.text().strip()
-        else:
+        # The focused panel is the destination
+        view = self._focused_view()
+        if view is None:
             QMessageBox.information(self, "Paste", "No panel focused")
             return
+        current_path = self._view_registry[view][2].text().strip()
         
-        file_info = QFileInfo(self.clipboard_path)
-        
-        if not file_info.exists():
+        if not os.path.exists(self.clipboard_path):
             QMessageBox.warning(self, "Paste", f"Source no longer exists: {self.clipboard_path}")
             self.clipboard_path = None
             self.update_clipboard_display()
             return
         
-        dest_path = QDir(current_path).filePath(file_info.fileName())
+        dest_path = os.path.join(current_path, self.clipboard_name)
         
-        # Avoid pasting to same location
-        if os.path.normpath(self.clipboard_path) == os.path.normpath(dest_path):
+        # Avoid pasting onto the source itself (also through symlinks or differently
+        # spelled paths); a destination that doesn't exist yet can't be the source
+        try:
+            same_file = os.path.samefile(self.clipboard_path, dest_path)
+        except OSError:
+            same_file = False
+        if same_file:
             QMessageBox.warning(self, "Paste", "Source and destination are the same")
             return
         
+        source_path = self.clipboard_path
         try:
             if self.clipboard_mode == "cut":
-                os.rename(self.clipboard_path, dest_path)
-                print(f"Moved: {self.clipboard_path} -> {dest_path}")
-                self.clipboard_path = None  # Clear clipboard after cut
-                self.clipboard_mode = None
-            else:  # copy
-                import shutil
-                if file_info.isDir():
-                    shutil.copytree(self.clipboard_path, dest_path)
-                else:
-                    shutil.copy2(self.clipboard_path, dest_path)
-                print(f"Copied: {self.clipboard_path} -> {dest_path}")
-            self.refresh()
-            self.right_refresh()
+                try:
+                    os.rename(self.clipboard_path, dest_path)
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+                    # shutil.move() would move the source *into* an existing
+                    # directory of that name; refuse like rename() does locally
+                    if os.path.lexists(dest_path):
+                        QMessageBox.warning(self, "Paste", f"Destination already exists: {dest_path}")
+                        return
+                    # Different filesystem: shutil.move copies (copy2 -> os.sendfile
+                    # where available) and then removes the source, so it runs in
+                    # the background; the clipboard is cleared once it is done
+                    self._start_file_op("move", source_path, dest_path,
+                                        functools.partial(shutil.move, source_path, dest_path))
+                    return
+                log.info("Moved %s -> %s", self.clipboard_path, dest_path)
+                self._clear_cut(source_path)
+                self._schedule_refresh(source_path, dest_path)
+            else:  # copy, in the background; panels refresh when it is done
+                if os.path.isdir(source_path) and os.path.isdir(dest_path):
+                    ok = QMessageBox.question(
+                        self, "Paste", f"{dest_path} already exists. Merge into it? "
+                        "Files that differ will be overwritten.", QMessageBox.Yes | QMessageBox.No)
+                    if ok != QMessageBox.Yes:
+                        return
+                copy_function = _link_or_copy if self.hardlink_on_copy else _fast_copy2
+                self._start_file_op("copy", source_path, dest_path,
+                                    functools.partial(_copy_path, source_path, dest_path, copy_function))
             self.update_clipboard_display()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Paste failed: {e}")
 
+    def _clear_cut(self, src: str):
+        """Empty the clipboard after src was moved, unless something else was cut or copied since."""
+        if self.clipboard_path == src:
+            self.clipboard_path = None
+            self.clipboard_mode = None
+            self.clipboard_name = None
+            self.update_clipboard_display()
+
+    def set_hardlink_on_copy(self, enabled: bool):
+        self.hardlink_on_copy = enabled
+
+    def _start_file_op(self, operation: str, src: str, dst: str, function):
+        """Run function on the file operation pool; see _FileOpWorker."""
+        self._active_file_ops += 1
+        self.file_op_progress.show()
+        self._file_op_pool.start(_FileOpWorker(self._file_op_signals, operation, src, dst, function))
+
+    def _file_op_done(self):
+        self._active_file_ops -= 1
+        if not self._active_file_ops:
+            self.file_op_progress.hide()
+
+    def _on_file_op_finished(self, operation: str, src: str, dst: str):
+        self._file_op_done()
+        if operation == "copy":
+            log.info("Copied %s -> %s", src, dst)
+            self._schedule_refresh(dst)
+        elif operation == "move":
+            log.info("Moved %s -> %s", src, dst)
+            self._clear_cut(src)
+            self._schedule_refresh(src, dst)
+        else:
+            log.info("Deleted %s", src)
+            self._schedule_refresh(src)
+
+    def _on_file_op_failed(self, operation: str, src: str, dst: str, error: str):
+        self._file_op_done()
+        # A partial copy or delete may have been left behind
+        if operation in ("copy", "move"):
+            self._schedule_refresh(src, dst)
+            QMessageBox.critical(self, "Error", f"Paste failed: {error}")
+        else:
+            self._schedule_refresh(src)
+            QMessageBox.warning(self, "Error", f"Could not remove directory: {error}")
+
     def update_clipboard_display(self):
         """Update the clipboard status bar display."""
         if not self.clipboard_path:
-            self.clipboard_label.setText("Clipboard: empty")
+            text = "Clipboard: empty"
         else:
-            file_name = QFileInfo(self.clipboard_path).fileName()
             mode = self.clipboard_mode.upper()
-            self.clipboard_label.setText(f"Clipboard: [{mode}] {file_name}")
+            text = f"Clipboard: [{mode}] {self.clipboard_name}"
+        # setText() relayouts and repaints the bar even for identical text
+        if text != self._last_clipboard_text:
+            self.clipboard_label.setText(text)
+            self._last_clipboard_text = text
 
     def set_focused_list(self, list_view):
         """Track which list view is focused."""
@@ -609,17 +837,15 @@ class FileManager(QMainWindow):
         """Handle double-click in right view."""
         source_index = self.right_proxy_model.mapToSource(index)
         path = self.right_file_model.filePath(source_index)
-        info = QFileInfo(path)
-        if info.exists():
-            if info.isDir():
-                self.right_set_path(path, add_history=True)
-                return
+        if os.path.isdir(path):
+            self.right_set_path(path, add_history=True)
+            return
         QDesktopServices.openUrl(QUrl.fromLocalFile(path))
 
     def right_goto_path(self):
         """Handle path entry in right view."""
         path = self.right_path_edit.text().strip()
-        if not QDir(path).exists():
+        if not os.path.isdir(path):
             QMessageBox.warning(self, "Not found", f"Path not found: {path}")
             return
         self.right_set_path(path, add_history=True)
@@ -635,8 +861,9 @@ class FileManager(QMainWindow):
     def right_refresh(self):
         """Refresh right view."""
         cur = self.right_path_edit.text()
-        self.right_file_model.setRootPath("")
-        self.right_file_model.setRootPath(cur)
+        self.right_delegate.invalidate_dir(cur)
+        self._load_directory(self.right_file_model, cur)
+        self.right_proxy_model.invalidate()
 
     def on_search_text_changed(self, text: str):
         """Handle search text changes."""
@@ -646,28 +873,14 @@ class FileManager(QMainWindow):
         """Show context menu for tag management and file operations."""
         # Determine which list triggered the menu
         sender = self.sender()
-        if sender == self.list:
-            index = self.list.indexAt(position)
-            model = self.search_proxy_model
-            source_model = self.file_model
-        elif sender == self.right_list:
-            index = self.right_list.indexAt(position)
-            model = self.right_proxy_model
-            source_model = self.right_file_model
-        else:
+        if sender not in self._view_registry:
             return
         
+        index = sender.indexAt(position)
         if not index.isValid():
             return
         
-        # Map from search proxy -> sort proxy -> file model
-        if sender == self.list:
-            sort_proxy_index = self.search_proxy_model.mapToSource(index)
-            source_index = self.proxy_model.mapToSource(sort_proxy_index)
-        else:
-            source_index = model.mapToSource(index)
-        
-        file_path = source_model.filePath(source_index)
+        file_path, _ = self._resolve_path(sender, index)
         
         menu = QMenu(self)
         
@@ -694,36 +907,39 @@ class FileManager(QMainWindow):
         tags = self.tag_manager.get_tags(file_path)
         if tags:
             menu.addSeparator()
+            # One group dispatches every removal; each action carries its tag as data
+            remove_group = QActionGroup(menu)
+            remove_group.setExclusionPolicy(QActionGroup.ExclusionPolicy.None_)
+            remove_group.triggered.connect(lambda action: self.tag_manager.remove_tag(file_path, action.data()))
             for tag in tags:
                 remove_action = menu.addAction(f"Remove: {tag}")
-                remove_action.triggered.connect(lambda checked=False, t=tag: self.tag_manager.remove_tag(file_path, t))
+                remove_action.setData(tag)
+                remove_group.addAction(remove_action)
             
             # Add "Remove all tags" option
             remove_all_action = menu.addAction("Remove all tags")
             remove_all_action.triggered.connect(lambda: self.remove_all_tags_from_file(file_path))
         
         menu.exec(sender.mapToGlobal(position))
-        self.refresh()
-        self.right_refresh()
+        self._schedule_refresh(file_path)
 
     def remove_all_tags_from_file(self, file_path: str):
         """Remove all tags from a file/folder."""
         self.tag_manager.set_tags(file_path, [])
-        self.refresh()
-        self.right_refresh()
+        self._schedule_refresh(file_path)
 
     def add_tag_dialog(self, file_path: str):
         """Show dialog to add a tag."""
         tag, ok = QInputDialog.getText(self, "Add Tag", "Enter tag name:")
         if ok and tag:
             self.tag_manager.add_tag(file_path, tag)
-            self.refresh()
-            self.right_refresh()
+            self._schedule_refresh(file_path)
 
 
 def main():
     app = QApplication(sys.argv)
-    win = FileManager("C:/Users/Gnathon/XXMI Launcher/ZZMI/Mods")
+    hardlink_on_copy = os.environ.get("SELECTR_HARDLINK_ON_COPY", "") == "1"
+    win = FileManager("C:/Users/Gnathon/XXMI Launcher/ZZMI/Mods", hardlink_on_copy)
     win.show()
     sys.exit(app.exec())
 